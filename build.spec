@@ -1,6 +1,44 @@
 # -*- mode: python ; coding: utf-8 -*-
+#
+# Build profiles:
+#   pyinstaller build.spec                              - single UPX-compressed executable
+#   NETFLOATER_PROFILE=fast pyinstaller build.spec      - fast launch: onedir (nothing to unpack
+#                                                         on start), no UPX, unused Qt left out
+
+import os
 
 block_cipher = None
+fast_launch = os.environ.get('NETFLOATER_PROFILE') == 'fast'
+
+# Qt bindings and stdlib modules NetFloater never imports
+FAST_EXCLUDES = [
+    'PyQt5.QtBluetooth', 'PyQt5.QtDBus', 'PyQt5.QtDesigner', 'PyQt5.QtHelp',
+    'PyQt5.QtLocation', 'PyQt5.QtMultimedia', 'PyQt5.QtMultimediaWidgets',
+    'PyQt5.QtNetwork', 'PyQt5.QtNfc', 'PyQt5.QtOpenGL', 'PyQt5.QtPositioning',
+    'PyQt5.QtPrintSupport', 'PyQt5.QtQml', 'PyQt5.QtQuick', 'PyQt5.QtQuickWidgets',
+    'PyQt5.QtRemoteObjects', 'PyQt5.QtSensors', 'PyQt5.QtSerialPort', 'PyQt5.QtSql',
+    'PyQt5.QtSvg', 'PyQt5.QtTest', 'PyQt5.QtTextToSpeech', 'PyQt5.QtWebChannel',
+    'PyQt5.QtWebEngineCore', 'PyQt5.QtWebEngineWidgets', 'PyQt5.QtWebSockets',
+    'PyQt5.QtXml', 'PyQt5.QtXmlPatterns',
+    'tkinter', 'unittest', 'pydoc', 'doctest', 'numpy',
+]
+
+# Qt plugin / data paths that are not needed on Windows at runtime
+FAST_PLUGIN_EXCLUDES = [
+    '/plugins/audio/', '/plugins/bearer/', '/plugins/generic/', '/plugins/geoservices/',
+    '/plugins/iconengines/', '/plugins/imageformats/', '/plugins/mediaservice/',
+    '/plugins/platformthemes/', '/plugins/playlistformats/', '/plugins/position/',
+    '/plugins/printsupport/', '/plugins/sensors/', '/plugins/sqldrivers/',
+    '/plugins/texttospeech/',
+    '/plugins/platforms/qminimal', '/plugins/platforms/qoffscreen', '/plugins/platforms/qwebgl',
+    '/translations/',
+]
+
+
+def keep_entry(entry):
+    path = '/' + entry[0].replace('\\', '/')
+    return not any(fragment in path for fragment in FAST_PLUGIN_EXCLUDES)
+
 
 a = Analysis(
     ['main.py'],
@@ -11,34 +49,69 @@ a = Analysis(
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
-    excludes=[],
+    excludes=FAST_EXCLUDES if fast_launch else [],
     win_no_prefer_redirects=False,
     win_private_assemblies=False,
     cipher=block_cipher,
     noarchive=False,
 )
 
+if fast_launch:
+    a.binaries = [entry for entry in a.binaries if keep_entry(entry)]
+    a.datas = [entry for entry in a.datas if keep_entry(entry)]
+
 pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
 
-exe = EXE(
-    pyz,
-    a.scripts,
-    a.binaries,
-    a.zipfiles,
-    a.datas,
-    [],
-    name='NetFloater v1.3',
-    debug=False,
-    bootloader_ignore_signals=False,
-    strip=False,
-    upx=True,
-    upx_exclude=[],
-    runtime_tmpdir=None,
-    console=False,
-    disable_windowed_traceback=False,
-    argv_emulation=False,
-    target_arch=None,
-    codesign_identity=None,
-    entitlements_file=None,
-    icon='floater_icon.png',
-)
\ No newline at end of file
+if fast_launch:
+    exe = EXE(
+        pyz,
+        a.scripts,
+        [],
+        exclude_binaries=True,
+        name='NetFloater v1.3',
+        debug=False,
+        bootloader_ignore_signals=False,
+        strip=False,
+        upx=False,
+        console=False,
+        disable_windowed_traceback=False,
+        argv_emulation=False,
+        target_arch=None,
+        codesign_identity=None,
+        entitlements_file=None,
+        icon='floater_icon.png',
+    )
+
+    coll = COLLECT(
+        exe,
+        a.binaries,
+        a.zipfiles,
+        a.datas,
+        strip=False,
+        upx=False,
+        upx_exclude=[],
+        name='NetFloater v1.3',
+    )
+else:
+    exe = EXE(
+        pyz,
+        a.scripts,
+        a.binaries,
+        a.zipfiles,
+        a.datas,
+        [],
+        name='NetFloater v1.3',
+        debug=False,
+        bootloader_ignore_signals=False,
+        strip=False,
+        upx=True,
+        upx_exclude=[],
+        runtime_tmpdir=None,
+        console=False,
+        disable_windowed_traceback=False,
+        argv_emulation=False,
+        target_arch=None,
+        codesign_identity=None,
+        entitlements_file=None,
+        icon='floater_icon.png',
+    )
\ No newline at end of file
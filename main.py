@@ -1,13 +1,35 @@
+import os
 import sys
-from PyQt5.QtWidgets import QApplication, QWidget, QSystemTrayIcon, QMenu, QAction
+import time
+from PyQt5.QtWidgets import QApplication, QWidget, QSystemTrayIcon, QMenu, QAction, QFileDialog
 from PyQt5.QtGui import QPainter
-from PyQt5.QtCore import Qt, QTimer, QPoint, QPropertyAnimation, pyqtProperty, QSize, QVariantAnimation
-
-from src.config_manager import ConfigManager
-from src.network_monitor import NetworkMonitor
-from src.auto_start_manager import AutoStartManager
-from src.ui_painter import UIPainter
-from src.language_manager import LanguageManager
+from PyQt5.QtCore import Qt, QTimer, QPoint, QRect, QPropertyAnimation, pyqtProperty, QSize, QVariantAnimation
+
+from py.config_manager import ConfigManager
+from py.network_monitor import NetworkMonitor
+from py.auto_start_manager import AutoStartManager
+from py.ui_painter import UIPainter
+from py.language_manager import LanguageManager
+from py.history_store import HistoryStore
+
+# Set to a file path to log first-paint / startup-complete wall times there
+# and quit once startup finishes (used by tools/startup_time.py)
+STARTUP_PROBE = os.environ.get('NETFLOATER_STARTUP_PROBE')
+
+def record_startup_event(name):
+    with open(STARTUP_PROBE, 'a', encoding='utf-8') as f:
+        f.write(f"{name} {time.time():.6f}\n")
+
+# Build the tray this long after show() even if the window is never painted
+STARTUP_FALLBACK_MS = 1000
+
+# Export ranges offered in the tray menu: (translation key, seconds back - None exports everything)
+EXPORT_RANGES = [
+    ('last_24_hours', 24 * 3600),
+    ('last_7_days', 7 * 24 * 3600),
+    ('last_30_days', 30 * 24 * 3600),
+    ('all_history', None),
+]
 
 class FloaterWidget(QWidget):
     def __init__(self):
@@ -20,8 +42,15 @@ class FloaterWidget(QWidget):
 
         # -------------------- Managers --------------------
         self.config_manager = ConfigManager()
-        self.network_monitor = NetworkMonitor()
-        self.auto_start_manager = AutoStartManager()
+        self.history_store = HistoryStore(
+            os.path.join(self.config_manager.config_dir, 'history'),
+            retention_days=self.config_manager.get('history_retention_days', 30)
+        )
+        self.network_monitor = NetworkMonitor(
+            self.config_manager.get('min_interval_ms', 100) / 1000,
+            self.config_manager.get('max_interval_ms', 5000) / 1000,
+            self.history_store
+        )
         self.ui_painter = UIPainter()
         self.language_manager = LanguageManager(self.config_manager)
 
@@ -39,6 +68,8 @@ class FloaterWidget(QWidget):
 
         # -------------------- Animations --------------------
         self.current_font_size = 10
+        self._painter = QPainter()
+        self._paint_rect = QRect()
         self.snap_anim = QPropertyAnimation(self, b"pos")
         self.snap_anim.setDuration(300)
         self._drag_opacity = 1.0
@@ -54,12 +85,43 @@ class FloaterWidget(QWidget):
         # Fade animation for smooth mode switch
         self._mode_opacity = 1.0
 
+        # History export running in the background
+        self.export_thread = None
+
+        # Startup stages (see finishStartup)
+        self.first_painted = False
+        self.startup_complete = False
+
         # -------------------- Init UI --------------------
         self.initUI()
         self.initTimers()
-        self.initTray()
         self.setWindowPosition()
+        self.show()
+
+        # Tray and menus are built after the first frame (see paintEvent).
+        # A window that is never exposed still gets its tray from this fallback
+        self.startup_timer = QTimer(self)
+        self.startup_timer.setSingleShot(True)
+        self.startup_timer.timeout.connect(self.finishStartup)
+        self.startup_timer.start(STARTUP_FALLBACK_MS)
+
+    def finishStartup(self):
+        """Second startup stage, run once after the first paint"""
+        if self.startup_complete:
+            return
+        self.startup_timer.stop()
+        self.auto_start_manager = AutoStartManager()
+        self.initTray()
         self.language_manager.language_changed.connect(self.on_language_changed)
+        self.startup_complete = True
+        if STARTUP_PROBE:
+            record_startup_event('startup_complete')
+            self.checkStartupProbe()
+
+    def checkStartupProbe(self):
+        """Quit once both startup events have been recorded"""
+        if self.first_painted and self.startup_complete:
+            QApplication.quit()
 
     # -------------------- Language --------------------
     def on_language_changed(self):
@@ -74,6 +136,9 @@ class FloaterWidget(QWidget):
         self.show_action.setText(self.language_manager.tr('show_hide'))
         self.quit_action.setText(self.language_manager.tr('exit'))
         self.language_menu.setTitle(self.language_manager.tr('language'))
+        self.export_menu.setTitle(self.language_manager.tr('export_history'))
+        for action in self.export_actions:
+            action.setText(self.language_manager.tr(action.data()[0]))
 
         current_lang = self.language_manager.current_lang
         for action in self.language_actions:
@@ -107,13 +172,14 @@ class FloaterWidget(QWidget):
         self.setAttribute(Qt.WA_TranslucentBackground)
         self.resize(60, 110) if self.compact_mode else self.resize(220, 80)
         self.setStyleSheet("background: transparent;")
-        self.show()
 
     def initTimers(self):
         """Initialize network and animation timers"""
         self.speed_timer = QTimer(self)
+        self.speed_timer.setSingleShot(True)
+        self.speed_timer.setTimerType(Qt.PreciseTimer)
         self.speed_timer.timeout.connect(self.updateSpeed)
-        self.speed_timer.start(1000)
+        self.speed_timer.start(self.network_monitor.next_interval_ms())
 
         self.animation_timer = QTimer(self)
         self.animation_timer.timeout.connect(self.updateAnimation)
@@ -158,6 +224,15 @@ class FloaterWidget(QWidget):
             self.language_menu.addAction(action)
             self.language_actions.append(action)
 
+        self.export_menu = QMenu(self.language_manager.tr('export_history'))
+        self.export_actions = []
+        for key, seconds in EXPORT_RANGES:
+            action = QAction(self.language_manager.tr(key), self)
+            action.setData((key, seconds))
+            action.triggered.connect(lambda checked, seconds=seconds: self.exportHistory(seconds))
+            self.export_menu.addAction(action)
+            self.export_actions.append(action)
+
         self.show_action = QAction(self.language_manager.tr('show_hide'), self)
         self.show_action.triggered.connect(self.toggleVisible)
 
@@ -167,6 +242,7 @@ class FloaterWidget(QWidget):
         menu.addAction(self.auto_start_action)
         menu.addAction(self.toggle_display_action)
         menu.addMenu(self.language_menu)
+        menu.addMenu(self.export_menu)
         menu.addAction(self.show_action)
         menu.addAction(self.quit_action)
         self.tray.setContextMenu(menu)
@@ -176,6 +252,44 @@ class FloaterWidget(QWidget):
         """Switch application language"""
         self.language_manager.set_language(lang_code)
 
+    # -------------------- History Export --------------------
+    def exportHistory(self, seconds):
+        """Export the last `seconds` of history (None = all) in a background thread"""
+        if self.export_thread is not None and self.export_thread.isRunning():
+            return
+
+        path, selected_filter = QFileDialog.getSaveFileName(
+            self, self.language_manager.tr('export_history'),
+            os.path.join(os.path.expanduser('~'), 'netfloater_history.csv'),
+            "CSV (*.csv);;NumPy columns (*.npy)"
+        )
+        if not path:
+            return
+        fmt = 'npy' if '*.npy' in selected_filter else 'csv'
+
+        # Make sure buffered samples are on disk before the worker reads the file
+        self.history_store.flush()
+        start = time.time() - seconds if seconds is not None else None
+
+        from py import history_exporter
+        self.export_thread = history_exporter.ExportThread(self.history_store, path, fmt, start, parent=self)
+        self.export_thread.progress.connect(self.on_export_progress)
+        self.export_thread.completed.connect(self.on_export_completed)
+        self.export_thread.failed.connect(self.on_export_failed)
+        self.export_thread.start()
+
+    def on_export_progress(self, done, total):
+        percent = done * 100 // total if total else 100
+        self.tray.setToolTip(f"{self.language_manager.tr('exporting')} {percent}%")
+
+    def on_export_completed(self, count, path):
+        self.tray.setToolTip(self.language_manager.tr('network_traffic_monitor'))
+        self.tray.showMessage(self.language_manager.tr('export_history'), f"{count} → {path}")
+
+    def on_export_failed(self, message):
+        self.tray.setToolTip(self.language_manager.tr('network_traffic_monitor'))
+        self.tray.showMessage(self.language_manager.tr('export_history'), message, QSystemTrayIcon.Warning)
+
     # -------------------- Mode Toggle with Animation --------------------
     def toggleWindowMode(self):
         """Toggle between compact and full mode with smooth animation and bounce"""
@@ -292,6 +406,9 @@ class FloaterWidget(QWidget):
             self.setToRightCenter()
 
     def quitApplication(self):
+        if self.export_thread is not None:
+            self.export_thread.wait()
+        self.history_store.close()
         self.config_manager.set('window_position', {'x': self.x(), 'y': self.y()})
         self.config_manager.set('compact_mode', self.compact_mode)
         self.config_manager.set('show_percentage', self.show_percentage)
@@ -302,8 +419,10 @@ class FloaterWidget(QWidget):
     def updateSpeed(self):
         self.network_monitor.update_speed()
         speeds = self.network_monitor.get_speeds()
-        self.download_speed = speeds['download']
-        self.upload_speed = speeds['upload']
+        self.download_speed = speeds.download
+        self.upload_speed = speeds.upload
+        # Adaptive cadence: re-arm with whatever the monitor asks for next
+        self.speed_timer.start(self.network_monitor.next_interval_ms())
 
     def updateAnimation(self):
         """Smooth traffic bar animation and font size adaptation"""
@@ -324,17 +443,10 @@ class FloaterWidget(QWidget):
         self.update()
 
     def calculateTextLength(self):
-        from PyQt5.QtGui import QFont, QFontMetrics
-        test_font = QFont("Segoe UI", 10)
-        metrics = QFontMetrics(test_font)
-        if self.show_percentage:
-            dl_percent = int(self._download_animation * 100)
-            ul_percent = int(self._upload_animation * 100)
-            text = f"↓ {dl_percent}%  ↑ {ul_percent}%"
-        else:
-            dl_text, ul_text = self.network_monitor.get_formatted_speeds()
-            text = f"{dl_text}  {ul_text}"
-        return metrics.horizontalAdvance(text)
+        return self.ui_painter.calculate_text_length(
+            self.show_percentage, self._download_animation, self._upload_animation,
+            self.download_speed, self.upload_speed
+        )
 
     # -------------------- Mouse Events --------------------
     def mousePressEvent(self, event):
@@ -361,10 +473,12 @@ class FloaterWidget(QWidget):
 
     # -------------------- Painting --------------------
     def paintEvent(self, event):
-        painter = QPainter(self)
+        painter = self._painter
+        painter.begin(self)
         painter.setRenderHint(QPainter.Antialiasing)
         painter.setOpacity(self.mode_opacity)
-        rect = self.rect()
+        rect = self._paint_rect
+        rect.setRect(0, 0, self.width(), self.height())
 
         self.ui_painter.paint_background(painter, rect)
 
@@ -377,6 +491,15 @@ class FloaterWidget(QWidget):
                 self.show_percentage, self.download_speed, self.upload_speed,
                 self.current_font_size, self.language_manager
             )
+        painter.end()
+
+        if not self.first_painted:
+            self.first_painted = True
+            if STARTUP_PROBE:
+                record_startup_event('first_paint')
+                self.checkStartupProbe()
+            # Queued so the frame reaches the screen before tray construction starts
+            QTimer.singleShot(0, self.finishStartup)
 
     # -------------------- Auto Snap --------------------
     def snapToEdge(self):
@@ -417,6 +540,12 @@ class FloaterWidget(QWidget):
 
 
 if __name__ == "__main__":
+    if '--export' in sys.argv:
+        # Headless export - no window, tray or event loop
+        from py import history_exporter
+        store = HistoryStore(os.path.join(ConfigManager().config_dir, 'history'))
+        sys.exit(history_exporter.main(sys.argv[1:], store))
+
     app = QApplication(sys.argv)
     floater = FloaterWidget()
     sys.exit(app.exec_())
@@ -11,6 +11,8 @@ from .config_manager import ConfigManager
 from .network_monitor import NetworkMonitor
 from .auto_start_manager import AutoStartManager
 from .ui_painter import UIPainter
+from .language_manager import LanguageManager
+from .history_store import HistoryStore
 
 
-__all__ = ['ConfigManager', 'NetworkMonitor', 'AutoStartManager', 'UIPainter']
+__all__ = ['ConfigManager', 'NetworkMonitor', 'AutoStartManager', 'UIPainter', 'LanguageManager', 'HistoryStore']
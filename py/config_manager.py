@@ -21,7 +21,10 @@ class ConfigManager:
             'show_percentage': False,
             'window_position': None,
             'auto_start': False,
-            'compact_mode': False
+            'compact_mode': False,
+            'min_interval_ms': 100,
+            'max_interval_ms': 5000,
+            'history_retention_days': 30
         }
     
     def save_config(self, config_data=None):
@@ -0,0 +1,169 @@
+WRAP_32 = 2 ** 32
+# Headroom over the reported link speed (PHY rates, renegotiation)
+LINK_SLACK = 2.0
+
+class InterfaceBaseline:
+    """Last counter totals seen for one interface"""
+    __slots__ = ('recv', 'sent', 'tick', 'wide', 'link_rate')
+
+    def __init__(self, recv, sent, tick):
+        self.recv = recv
+        self.sent = sent
+        self.tick = tick
+        # Seen at or above 2^32, so the counters cannot be 32-bit
+        self.wide = recv >= WRAP_32 or sent >= WRAP_32
+        # Reported link speed with slack in bytes/s, 0 while unknown
+        self.link_rate = 0.0
+
+
+class CounterDeltaEngine:
+    """Turn per-interface byte counters into validated deltas.
+
+    Every interface keeps its own baseline, so a NIC appearing or vanishing
+    never shows up as a jump in the total. Counters that go backwards are
+    classified as a 32-bit wraparound or a reset; deltas above max_rate are
+    dropped. Intervals spanning a suspend (or a stalled event loop) are
+    discarded as a whole and all baselines are re-taken. Each update is
+    O(interfaces).
+
+    read_link_stats, when given, returns {name: stats with .speed in Mbit/s}
+    like psutil.net_if_stats(). It is read at most once every
+    `link_refresh` seconds. Link speed only decides whether a backwards
+    step is a believable 32-bit wrap - it never caps forward deltas, since
+    TAP/VPN adapters and renegotiated Wi-Fi links often carry more than
+    they report.
+    """
+
+    def __init__(self, max_rate=12.5e9, gap_factor=3.0, min_gap=2.0, read_link_stats=None, link_refresh=30.0):
+        self.max_rate = max_rate  # bytes/s ceiling for any interface, 100 Gbit/s
+        self.gap_factor = gap_factor
+        self.min_gap = min_gap
+        self.read_link_stats = read_link_stats
+        self.link_refresh = link_refresh
+        self.links_read_at = None
+
+        self.baselines = {}
+        self.last_time = None
+        self.last_wall = None
+        self.tick = 0
+
+        # Result of the last update
+        self.recv_delta = 0
+        self.sent_delta = 0
+        self.elapsed = 0.0
+
+        # Statistics
+        self.added = 0
+        self.removed = 0
+        self.wraps = 0
+        self.resets = 0
+        self.clamped = 0
+        self.gaps = 0
+
+    def _delta(self, value, last_value, limit, wrap_limit):
+        """Validated delta for one counter"""
+        delta = value - last_value
+        if delta < 0:
+            wrapped = delta + WRAP_32
+            if last_value < WRAP_32 and 0 <= wrapped <= wrap_limit:
+                self.wraps += 1
+                return wrapped
+            # Reset (driver reload, resume) - only bytes counted since then are known
+            self.resets += 1
+            return value if value <= limit else 0
+        if delta > limit:
+            self.clamped += 1
+            return 0
+        return delta
+
+    def _refresh_link_rates(self, now):
+        """Read each interface's reported link speed"""
+        self.links_read_at = now
+        if self.read_link_stats is None:
+            return
+        try:
+            stats = self.read_link_stats()
+        except Exception as e:
+            print(f"Failed to read link speeds: {e}")
+            return
+        for name, base in self.baselines.items():
+            nic = stats.get(name)
+            speed = nic.speed if nic is not None else 0
+            # 0 means unknown (loopback, many VPN adapters)
+            base.link_rate = speed * 125000 * LINK_SLACK if speed > 0 else 0.0
+
+    def update(self, counters, now, wall, expected_interval):
+        """Feed a {name: counters} mapping sampled at monotonic time `now` and
+        wall time `wall`. Returns True when recv_delta / sent_delta / elapsed
+        hold a valid interval, False when it was discarded.
+        """
+        self.tick += 1
+        tick = self.tick
+        baselines = self.baselines
+
+        first = self.last_time is None
+        valid = False
+        elapsed = 0.0
+        if not first:
+            elapsed = now - self.last_time
+            # On Windows the monotonic clock keeps running during suspend; on
+            # Linux it stops, which shows up as wall time racing ahead of it
+            gap = (elapsed > max(expected_interval * self.gap_factor, self.min_gap)
+                   or (wall - self.last_wall) - elapsed > self.min_gap)
+            if gap:
+                self.gaps += 1
+            valid = not gap and elapsed > 0
+        self.last_time = now
+        self.last_wall = wall
+
+        recv_total = 0
+        sent_total = 0
+        limit = self.max_rate * elapsed
+        for name, nic in counters.items():
+            recv = nic.bytes_recv
+            sent = nic.bytes_sent
+            base = baselines.get(name)
+            if base is None:
+                # New interface - its first reading is only a baseline
+                baselines[name] = InterfaceBaseline(recv, sent, tick)
+                if not first:
+                    self.added += 1
+                continue
+            if valid:
+                # A 2^32 wrap is only believable for counters never seen past
+                # 32 bits on a link whose speed bounds the wrapped delta
+                wrap_limit = -1.0 if base.wide else base.link_rate * elapsed
+                recv_total += self._delta(recv, base.recv, limit, wrap_limit)
+                sent_total += self._delta(sent, base.sent, limit, wrap_limit)
+            if not base.wide and (recv >= WRAP_32 or sent >= WRAP_32):
+                base.wide = True
+            base.recv = recv
+            base.sent = sent
+            base.tick = tick
+
+        if len(baselines) > len(counters):
+            for name in [name for name, base in baselines.items() if base.tick != tick]:
+                del baselines[name]
+                self.removed += 1
+
+        # New interfaces pick up their link speed on the next refresh - until
+        # then they never wrap
+        if self.links_read_at is None or now - self.links_read_at >= self.link_refresh:
+            self._refresh_link_rates(now)
+
+        self.recv_delta = recv_total
+        self.sent_delta = sent_total
+        self.elapsed = elapsed
+        return valid
+
+    def get_stats(self):
+        """Get counts of detected interface and counter events"""
+        return {
+            'interfaces': len(self.baselines),
+            'added': self.added,
+            'removed': self.removed,
+            'wraps': self.wraps,
+            'resets': self.resets,
+            'clamped': self.clamped,
+            'gaps': self.gaps
+        }
\ No newline at end of file
@@ -0,0 +1,149 @@
+import os
+import sys
+import struct
+import argparse
+from array import array
+from datetime import datetime
+
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from .history_store import RECORD
+
+COLUMNS = ('timestamp', 'download', 'upload')
+# Fixed header size, so the row count can be rewritten in place once known
+NPY_HEADER_SIZE = 128
+
+
+def iter_csv_chunks(chunks):
+    """Turn raw record chunks into (record count, CSV text) pairs"""
+    for chunk in chunks:
+        yield len(chunk) // RECORD.size, ''.join(f"{t:.3f},{dl:.3f},{ul:.3f}\n" for t, dl, ul in RECORD.iter_unpack(chunk))
+
+
+def iter_column_chunks(chunks):
+    """Turn raw record chunks into (record count, per-column little-endian float64 bytes) pairs"""
+    for chunk in chunks:
+        values = array('d', chunk)
+        if sys.byteorder == 'big':
+            values.byteswap()
+        yield len(chunk) // RECORD.size, [values[i::len(COLUMNS)].tobytes() for i in range(len(COLUMNS))]
+
+
+def npy_header(count):
+    """Build a NPY_HEADER_SIZE byte .npy v1.0 header for a 1-D float64 array of count items"""
+    header = "{'descr': '<f8', 'fortran_order': False, 'shape': (%d,), }" % count
+    # magic(6) + version(2) + length field(2) + header, padded and ended by a newline
+    header = header.ljust(NPY_HEADER_SIZE - 10 - 1) + '\n'
+    return b'\x93NUMPY\x01\x00' + struct.pack('<H', len(header)) + header.encode('latin1')
+
+
+def npy_paths(path):
+    """Column file paths for an .npy export: out.npy -> out_timestamp.npy, ..."""
+    base = path[:-4] if path.lower().endswith('.npy') else path
+    return [f"{base}_{name}.npy" for name in COLUMNS]
+
+
+def export_history(store, path, fmt=None, start=None, end=None, chunk_records=4096, progress=None):
+    """Stream history records for start <= timestamp < end to path.
+
+    fmt is 'csv' or 'npy' (guessed from the extension when omitted). Memory
+    use is bounded by chunk_records regardless of history size. progress is
+    called as progress(done, total) after every chunk. Returns the number
+    of records written.
+    """
+    if fmt is None:
+        fmt = 'npy' if path.lower().endswith('.npy') else 'csv'
+
+    spans = store.select(start, end)
+    total = sum(last - first for _, first, last in spans)
+    chunks = store.iter_chunks(spans, chunk_records)
+    done = 0
+
+    if fmt == 'csv':
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            f.write(','.join(COLUMNS) + '\n')
+            for count, text in iter_csv_chunks(chunks):
+                f.write(text)
+                done += count
+                if progress:
+                    progress(done, total)
+    elif fmt == 'npy':
+        files = [open(p, 'wb') for p in npy_paths(path)]
+        try:
+            header = npy_header(total)
+            for f in files:
+                f.write(header)
+            for count, columns in iter_column_chunks(chunks):
+                for f, data in zip(files, columns):
+                    f.write(data)
+                done += count
+                if progress:
+                    progress(done, total)
+            if done != total:
+                # A segment was pruned or cut short mid-export - fix the row count
+                header = npy_header(done)
+                for f in files:
+                    f.seek(0)
+                    f.write(header)
+        finally:
+            for f in files:
+                f.close()
+    else:
+        raise ValueError(f"Unknown export format: {fmt}")
+
+    return done
+
+
+class ExportThread(QThread):
+    """Run export_history off the GUI thread"""
+    progress = pyqtSignal(int, int)
+    completed = pyqtSignal(int, str)
+    failed = pyqtSignal(str)
+
+    def __init__(self, store, path, fmt=None, start=None, end=None, parent=None):
+        super().__init__(parent)
+        self.store = store
+        self.path = path
+        self.fmt = fmt
+        self.start_time = start
+        self.end_time = end
+
+    def run(self):
+        try:
+            count = export_history(
+                self.store, self.path, self.fmt, self.start_time, self.end_time,
+                progress=self.progress.emit
+            )
+            self.completed.emit(count, self.path)
+        except Exception as e:
+            self.failed.emit(str(e))
+
+
+def parse_time(value):
+    """Parse a unix timestamp or ISO 8601 datetime"""
+    try:
+        return float(value)
+    except ValueError:
+        return datetime.fromisoformat(value).timestamp()
+
+
+def main(argv, store):
+    """Headless export entry point"""
+    parser = argparse.ArgumentParser(prog='NetFloater', description='Export traffic history')
+    parser.add_argument('--export', metavar='PATH', required=True, help='output .csv or .npy file')
+    parser.add_argument('--format', choices=['csv', 'npy'], help='defaults to the PATH extension')
+    parser.add_argument('--since', type=parse_time, help='unix time or ISO datetime (inclusive)')
+    parser.add_argument('--until', type=parse_time, help='unix time or ISO datetime (exclusive)')
+    args = parser.parse_args(argv)
+
+    def report(done, total):
+        percent = done * 100 // total if total else 100
+        print(f"\rExporting... {percent}%", end='', file=sys.stderr)
+
+    try:
+        count = export_history(store, args.export, args.format, args.since, args.until, progress=report)
+    except Exception as e:
+        print(f"\nFailed to export history: {e}", file=sys.stderr)
+        return 1
+    print(f"\nExported {count} samples to {os.path.abspath(args.export)}", file=sys.stderr)
+    return 0
\ No newline at end of file
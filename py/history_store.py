@@ -0,0 +1,187 @@
+import os
+import time
+import struct
+
+# One sample: wall-clock timestamp, download KB/s, upload KB/s
+RECORD = struct.Struct('<ddd')
+DAY = 86400
+
+class HistoryStore:
+    """Traffic history kept as daily segment files of fixed-size records.
+
+    Samples are averaged down to one record per `resolution` seconds before
+    they are written, and segments older than `retention_days` are deleted,
+    so the history stays bounded however long the app runs. Records inside
+    a segment are in time order, so a time range maps to a contiguous slice
+    of each segment that is found with a binary search and streamed in
+    chunks without loading the history into memory.
+    """
+
+    def __init__(self, folder, resolution=1.0, retention_days=30, buffer_records=60):
+        self.folder = folder
+        self.resolution = resolution
+        self.retention_days = retention_days
+
+        self._capacity = buffer_records
+        self._buffer = bytearray(RECORD.size * buffer_records)
+        self._view = memoryview(self._buffer)
+        self._count = 0
+        self._buffer_day = None
+
+        # Time-weighted average of the samples in the current resolution step
+        self._download_sum = 0.0
+        self._upload_sum = 0.0
+        self._elapsed_sum = 0.0
+
+        # Segment currently being appended to
+        self._file = None
+        self._day = None
+
+    # -------------------- Writing --------------------
+    def append(self, timestamp, download_speed, upload_speed, elapsed):
+        """Add a sample covering `elapsed` seconds that ended at `timestamp`"""
+        self._download_sum += download_speed * elapsed
+        self._upload_sum += upload_speed * elapsed
+        self._elapsed_sum += elapsed
+        if self._elapsed_sum < self.resolution:
+            return
+
+        # Never mix two days in one buffer - each flush targets one segment
+        day = int(timestamp // DAY)
+        if self._count and day != self._buffer_day:
+            self.flush()
+        self._buffer_day = day
+
+        RECORD.pack_into(
+            self._buffer, self._count * RECORD.size, timestamp,
+            self._download_sum / self._elapsed_sum, self._upload_sum / self._elapsed_sum
+        )
+        self._download_sum = 0.0
+        self._upload_sum = 0.0
+        self._elapsed_sum = 0.0
+        self._count += 1
+        if self._count == self._capacity:
+            self.flush()
+
+    def flush(self):
+        """Write buffered records to disk"""
+        if not self._count:
+            return True
+        try:
+            if self._buffer_day != self._day:
+                self._open_segment(self._buffer_day)
+            data = self._view if self._count == self._capacity else self._view[:self._count * RECORD.size]
+            # Raw file - write() may be short, and there is no buffer to flush
+            written = self._file.write(data)
+            while written < len(data):
+                written += self._file.write(data[written:])
+            return True
+        except Exception as e:
+            print(f"Failed to save history: {e}")
+            return False
+        finally:
+            self._count = 0
+
+    def close(self):
+        """Flush and close the current segment"""
+        self.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._day = None
+
+    def _segment_path(self, day):
+        return os.path.join(self.folder, time.strftime('%Y-%m-%d', time.gmtime(day * DAY)) + '.bin')
+
+    def _open_segment(self, day):
+        """Switch appends to the segment for `day` and apply retention"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if not os.path.exists(self.folder):
+            os.makedirs(self.folder)
+        # Unbuffered: records are already batched in self._buffer, and a
+        # buffered writer would copy them again on every flush
+        self._file = open(self._segment_path(day), 'ab', buffering=0)
+        # A crash mid-write can leave a partial record - cut it off so
+        # later appends stay aligned
+        size = self._file.seek(0, os.SEEK_END)
+        if size % RECORD.size:
+            self._file.truncate(size - size % RECORD.size)
+        self._day = day
+        self.prune(day)
+
+    def prune(self, today=None):
+        """Delete segments older than retention_days"""
+        if today is None:
+            today = int(time.time() // DAY)
+        oldest = self._segment_path(today - self.retention_days + 1)
+        for path in self.segments():
+            if path >= oldest:
+                break
+            try:
+                os.remove(path)
+            except Exception as e:
+                # Probably open in an export - try again on the next day switch
+                print(f"Failed to remove old history {path}: {e}")
+
+    # -------------------- Reading --------------------
+    def segments(self):
+        """Segment file paths, oldest first"""
+        if not os.path.exists(self.folder):
+            return []
+        return [os.path.join(self.folder, name) for name in sorted(os.listdir(self.folder)) if name.endswith('.bin')]
+
+    def _search(self, f, total, timestamp):
+        """Index of the first record at or after timestamp"""
+        low, high = 0, total
+        while low < high:
+            mid = (low + high) // 2
+            f.seek(mid * RECORD.size)
+            if struct.unpack('<d', f.read(8))[0] < timestamp:
+                low = mid + 1
+            else:
+                high = mid
+        return low
+
+    def select(self, start=None, end=None):
+        """Get (path, first, last) record spans for start <= timestamp < end"""
+        first_day = self._segment_path(int(start // DAY)) if start is not None else None
+        last_day = self._segment_path(int(end // DAY)) if end is not None else None
+        spans = []
+        for path in self.segments():
+            # Segment names sort by day, so whole segments outside the range are skipped unread
+            if (first_day is not None and path < first_day) or (last_day is not None and path > last_day):
+                continue
+            with open(path, 'rb') as f:
+                total = os.fstat(f.fileno()).st_size // RECORD.size
+                first = 0 if start is None else self._search(f, total, start)
+                last = total if end is None else self._search(f, total, end)
+            if last > first:
+                spans.append((path, first, last))
+        return spans
+
+    def iter_chunks(self, spans, chunk_records=4096):
+        """Yield raw bytes for the records in spans, chunk_records at a time"""
+        for path, first, last in spans:
+            try:
+                f = open(path, 'rb')
+            except FileNotFoundError:
+                # Pruned since select()
+                continue
+            with f:
+                f.seek(first * RECORD.size)
+                remaining = last - first
+                while remaining > 0:
+                    count = min(chunk_records, remaining)
+                    data = f.read(count * RECORD.size)
+                    data = data[:len(data) - len(data) % RECORD.size]
+                    if not data:
+                        break
+                    yield data
+                    remaining -= count
+
+    def iter_records(self, start=None, end=None, chunk_records=4096):
+        """Yield (timestamp, download, upload) tuples for start <= timestamp < end"""
+        for chunk in self.iter_chunks(self.select(start, end), chunk_records):
+            yield from RECORD.iter_unpack(chunk)
\ No newline at end of file
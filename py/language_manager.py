@@ -0,0 +1,60 @@
+from PyQt5.QtCore import QObject, pyqtSignal
+
+TRANSLATIONS = {
+    'en': {
+        'network_traffic_monitor': 'Network Traffic Monitor',
+        'start_with_windows': 'Start with Windows',
+        'show_percentage': 'Show Percentage',
+        'language': 'Language',
+        'export_history': 'Export History',
+        'exporting': 'Exporting history...',
+        'last_24_hours': 'Last 24 Hours',
+        'last_7_days': 'Last 7 Days',
+        'last_30_days': 'Last 30 Days',
+        'all_history': 'All History',
+        'show_hide': 'Show/Hide',
+        'exit': 'Exit'
+    },
+    'zh': {
+        'network_traffic_monitor': '网络流量监控',
+        'start_with_windows': '开机自启动',
+        'show_percentage': '显示百分比',
+        'language': '语言',
+        'export_history': '导出历史记录',
+        'exporting': '正在导出历史记录...',
+        'last_24_hours': '最近 24 小时',
+        'last_7_days': '最近 7 天',
+        'last_30_days': '最近 30 天',
+        'all_history': '全部记录',
+        'show_hide': '显示/隐藏',
+        'exit': '退出'
+    }
+}
+
+LANGUAGE_NAMES = [('en', 'English'), ('zh', '简体中文')]
+
+class LanguageManager(QObject):
+    language_changed = pyqtSignal()
+
+    def __init__(self, config_manager):
+        super().__init__()
+        self.config_manager = config_manager
+        self.current_lang = self.config_manager.get('language', 'en')
+        if self.current_lang not in TRANSLATIONS:
+            self.current_lang = 'en'
+
+    def tr(self, key):
+        """Translate a text key, falling back to English"""
+        return TRANSLATIONS[self.current_lang].get(key, TRANSLATIONS['en'].get(key, key))
+
+    def get_available_languages(self):
+        """Get (code, display name) pairs"""
+        return LANGUAGE_NAMES
+
+    def set_language(self, lang_code):
+        """Switch language and notify listeners"""
+        if lang_code not in TRANSLATIONS or lang_code == self.current_lang:
+            return
+        self.current_lang = lang_code
+        self.config_manager.set('language', lang_code)
+        self.language_changed.emit()
\ No newline at end of file
@@ -1,35 +1,185 @@
+import time
+from functools import partial
+
 import psutil
 
-class NetworkMonitor:
+from .counter_delta import CounterDeltaEngine
+
+class AdaptiveInterval:
+    """Pick the next polling interval from how much recent rates change.
+
+    Bursts tighten the interval towards min_interval. Steady rates relax it
+    back to base_interval, and only an idle link (total below idle_rate)
+    backs off further towards max_interval - a steady download is calm but
+    still worth watching at the normal cadence.
+    """
+
+    def __init__(self, min_interval=0.1, max_interval=5.0, base_interval=1.0,
+                 burst_threshold=0.5, calm_threshold=0.1, noise_floor=1.0, min_change=32.0,
+                 idle_rate=16.0):
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.base_interval = base_interval
+        self.burst_threshold = burst_threshold
+        self.calm_threshold = calm_threshold
+        self.noise_floor = noise_floor  # KB/s
+        # KB/s - rate changes smaller than this never count, so a few idle
+        # packets landing in a short interval cannot look like a burst.
+        # min_change and idle_rate were calibrated against the synthetic
+        # traces from tools/make_traces.py (idle/bursty/steady.csv), see
+        # `python tools/sampling_stats.py check`
+        self.min_change = min_change
+        self.idle_rate = idle_rate  # KB/s
+
+        self.interval = min(max(base_interval, min_interval), max_interval)
+        self.volatility = 0.0
+        self.last_total = None
+
+        # Statistics
+        self.wakeups = 0
+        self.elapsed = 0.0
+
+    def update(self, download_speed, upload_speed, elapsed):
+        """Feed the latest rates and return the next interval in seconds"""
+        total = download_speed + upload_speed
+        if self.last_total is None or abs(total - self.last_total) < self.min_change:
+            change = 0.0
+        else:
+            change = abs(total - self.last_total) / max(total, self.last_total, self.noise_floor)
+        self.last_total = total
+        self.volatility = self.volatility * 0.5 + change * 0.5
+
+        if self.volatility > self.burst_threshold:
+            # Burst - tighten quickly
+            self.interval = max(self.min_interval, self.interval * 0.25)
+        elif self.volatility < self.calm_threshold:
+            # Quiet - back off gradually
+            self.interval = min(self.max_interval, self.interval * 1.5)
+
+        if total >= self.idle_rate and self.interval > self.base_interval:
+            # Traffic flowing - never slower than the base cadence
+            self.interval = self.base_interval
+
+        self.wakeups += 1
+        self.elapsed += elapsed
+        return self.interval
+
+    def get_stats(self):
+        """Get wakeup statistics against a fixed base_interval cadence"""
+        fixed_wakeups = int(self.elapsed / self.base_interval)
+        return {
+            'wakeups': self.wakeups,
+            'fixed_wakeups': fixed_wakeups,
+            'wakeups_saved': fixed_wakeups - self.wakeups,
+            'elapsed': self.elapsed,
+            'interval': self.interval
+        }
+
+
+def replay_trace(trace, **kwargs):
+    """Replay a recorded trace of (monotonic_time, bytes_recv, bytes_sent)
+    samples through AdaptiveInterval and return its statistics.
+
+    The trace should be recorded at a finer cadence than min_interval;
+    the sampler only "wakes up" on the first sample at or past its deadline.
+    """
+    sampler = AdaptiveInterval(**kwargs)
+    samples = iter(trace)
+    try:
+        last_time, last_recv, last_sent = next(samples)
+    except StopIteration:
+        return sampler.get_stats()
+
+    deadline = last_time + sampler.interval
+    for now, recv, sent in samples:
+        if now < deadline:
+            continue
+        elapsed = now - last_time
+        download_speed = (recv - last_recv) / 1024 / elapsed
+        upload_speed = (sent - last_sent) / 1024 / elapsed
+        deadline = now + sampler.update(download_speed, upload_speed, elapsed)
+        last_time, last_recv, last_sent = now, recv, sent
+
+    return sampler.get_stats()
+
+
+class SpeedSnapshot:
+    """Latest speeds in KB/s, updated in place on every sample"""
+    __slots__ = ('download', 'upload', 'timestamp')
+
     def __init__(self):
-        self.last_bytes = psutil.net_io_counters()
+        self.download = 0.0
+        self.upload = 0.0
+        self.timestamp = 0.0
+
+
+class NetworkMonitor:
+    def __init__(self, min_interval=0.1, max_interval=5.0, history=None):
+        self.history = history
+        # Clocks are attributes so tools/tick_alloc.py can drive them
+        self.clock = time.monotonic
+        self.wall_clock = time.time
+        # Raw per-interface counters - CounterDeltaEngine handles wraps and resets itself
+        self.read_counters = partial(psutil.net_io_counters, pernic=True, nowrap=False)
         self.download_speed = 0.0
         self.upload_speed = 0.0
-    
+        self.snapshot = SpeedSnapshot()
+        self.sampler = AdaptiveInterval(min_interval, max_interval)
+        self.deltas = CounterDeltaEngine(read_link_stats=psutil.net_if_stats)
+
+        # First reading only sets the per-interface baselines
+        now = self.clock()
+        self.deltas.update(self.read_counters(), now, self.wall_clock(), self.sampler.interval)
+        self.snapshot.timestamp = now
+
     def update_speed(self):
         """Update network speed"""
-        now_bytes = psutil.net_io_counters()
-        self.download_speed = (now_bytes.bytes_recv - self.last_bytes.bytes_recv) / 1024
-        self.upload_speed = (now_bytes.bytes_sent - self.last_bytes.bytes_sent) / 1024
-        self.last_bytes = now_bytes
-    
+        counters = self.read_counters()
+        now = self.clock()
+        wall = self.wall_clock()
+        deltas = self.deltas
+        # sampler.interval is still the interval this sample was scheduled with
+        if not deltas.update(counters, now, wall, self.sampler.interval):
+            # Suspend gap or clock hiccup - drop the interval, keep the baselines
+            return
+        elapsed = deltas.elapsed
+        self.download_speed = deltas.recv_delta / 1024 / elapsed
+        self.upload_speed = deltas.sent_delta / 1024 / elapsed
+
+        snapshot = self.snapshot
+        snapshot.download = self.download_speed
+        snapshot.upload = self.upload_speed
+        snapshot.timestamp = now
+        if self.history is not None:
+            self.history.append(wall, self.download_speed, self.upload_speed, elapsed)
+        self.sampler.update(self.download_speed, self.upload_speed, elapsed)
+
+    def next_interval_ms(self):
+        """Get the next polling interval in milliseconds"""
+        return int(self.sampler.interval * 1000)
+
+    def get_sampling_stats(self):
+        """Get wakeups saved versus a fixed cadence"""
+        return self.sampler.get_stats()
+
+    def get_counter_stats(self):
+        """Get interface add/remove, wrap, reset and suspend gap counts"""
+        return self.deltas.get_stats()
+
     def get_speeds(self):
-        """Get current speeds"""
-        return {
-            'download': self.download_speed,
-            'upload': self.upload_speed
-        }
-    
+        """Get current speeds as a SpeedSnapshot (reused between calls - copy the fields)"""
+        return self.snapshot
+
     def get_formatted_speeds(self):
         """Get formatted speed text"""
         if self.download_speed > 1024:
             dl_text = f"{self.download_speed/1024:.1f} MB/s"
         else:
             dl_text = f"{self.download_speed:.1f} KB/s"
-            
+
         if self.upload_speed > 1024:
             ul_text = f"{self.upload_speed/1024:.1f} MB/s"
         else:
             ul_text = f"{self.upload_speed:.1f} KB/s"
-        
+
         return dl_text, ul_text
\ No newline at end of file
@@ -1,166 +1,257 @@
-from PyQt5.QtGui import QPainter, QPainterPath, QColor, QFont, QIcon, QLinearGradient, QFontMetrics, QPixmap, QPen
-from PyQt5.QtCore import Qt, QRectF
+from PyQt5.QtGui import QPainter, QColor, QFont, QIcon, QLinearGradient, QFontMetrics, QPixmap, QPen, QBrush
+from PyQt5.QtCore import Qt, QRectF, QPointF
+
+# Percentage labels are drawn every frame - build them once
+DL_PERCENT_TEXT = [f"↓ {i}%" for i in range(101)]
+UL_PERCENT_TEXT = [f"↑ {i}%" for i in range(101)]
+
+
+def format_speed(arrow, speed):
+    """Format a KB/s speed with its direction arrow"""
+    if speed > 1024:
+        return f"{arrow} {speed/1024:.1f} MB/s"
+    return f"{arrow} {speed:.1f} KB/s"
+
+
+def percent_index(anim):
+    """Clamp an animation value to an index into the percent label tables"""
+    return min(max(int(anim * 100), 0), 100)
+
+
+class SpeedText:
+    """Speed label that is only rebuilt when its displayed value changes"""
+    __slots__ = ('arrow', 'megabytes', 'value', 'text')
+
+    def __init__(self, arrow):
+        self.arrow = arrow
+        self.megabytes = None
+        self.value = None
+        self.text = ''
+
+    def get(self, speed):
+        speed = max(speed, 0.0)
+        megabytes = speed > 1024
+        # round(x, 1) rounds exactly like the .1f format, so equal values
+        # always mean equal text
+        value = round(speed / 1024, 1) if megabytes else round(speed, 1)
+        if value != self.value or megabytes != self.megabytes:
+            self.megabytes = megabytes
+            self.value = value
+            self.text = format_speed(self.arrow, speed)
+        return self.text
+
 
 class UIPainter:
     def __init__(self):
         self.radius = 16
-    
+
+        # Everything below is reused across paints so a steady-state frame
+        # does not allocate new Qt objects. Most calls also pass exactly the
+        # types of PyQt's first matching overload (QBrush, QColor, QPointF):
+        # every overload sip tries and rejects first costs a Python allocation
+        self._bg_rect = QRectF()
+        self._outline_rect = QRectF()
+        self._bg_color = QColor(20, 20, 20, 120)
+        # setPen(QColor) gives the same 1px solid pen as QPen(color, 1)
+        self._outline_color = QColor(255, 255, 255, 80)
+        self._no_pen = QPen(Qt.NoPen)
+        self._no_brush = QBrush(Qt.NoBrush)
+
+        self._start = QPointF()
+        self._stop = QPointF()
+        self._text_pos = QPointF()
+
+        self._dl_container_rect = QRectF()
+        self._ul_container_rect = QRectF()
+        self._dl_rect = QRectF()
+        self._ul_rect = QRectF()
+
+        # Full mode - horizontal gradients
+        self._dl_h_gradient = QLinearGradient()
+        self._dl_h_gradient.setColorAt(0, QColor(76, 175, 80, 220))
+        self._dl_h_gradient.setColorAt(1, QColor(129, 199, 132, 220))
+        self._ul_h_gradient = QLinearGradient()
+        self._ul_h_gradient.setColorAt(0, QColor(255, 152, 0, 220))
+        self._ul_h_gradient.setColorAt(1, QColor(255, 183, 77, 220))
+
+        # Compact mode - vertical gradients, light to dark
+        self._dl_v_gradient = QLinearGradient()
+        self._dl_v_gradient.setColorAt(0, QColor(129, 199, 132, 220))
+        self._dl_v_gradient.setColorAt(1, QColor(76, 175, 80, 220))
+        self._ul_v_gradient = QLinearGradient()
+        self._ul_v_gradient.setColorAt(0, QColor(255, 183, 77, 220))
+        self._ul_v_gradient.setColorAt(1, QColor(255, 152, 0, 220))
+
+        self._dl_text_color = QColor(76, 175, 80)
+        self._ul_text_color = QColor(255, 152, 0)
+        self._font = QFont("Segoe UI", 10)
+        self._font.setBold(True)
+
+        self._dl_text = SpeedText("↓")
+        self._ul_text = SpeedText("↑")
+
+        # Text width measurement
+        self._metrics = QFontMetrics(QFont("Segoe UI", 10))
+        self._measured_dl = None
+        self._measured_ul = None
+        self._measured_width = 0
+
     def create_tray_icon(self):
         """Create system tray icon"""
         pixmap = QPixmap(16, 16)
         pixmap.fill(Qt.transparent)
-        
+
         painter = QPainter(pixmap)
         painter.setRenderHint(QPainter.Antialiasing)
-        
+
         # Draw network traffic icon
         painter.setBrush(QColor(76, 175, 80))  # Download green
         painter.drawEllipse(2, 2, 6, 6)  # Bottom-left dot - download
-        
+
         painter.setBrush(QColor(255, 152, 0))  # Upload orange
         painter.drawEllipse(8, 8, 6, 6)  # Top-right dot - upload
-        
+
         # Connection line
         painter.setPen(QPen(QColor(200, 200, 200, 180), 1))
         painter.drawLine(5, 5, 11, 11)
-        
+
         painter.end()
-        
+
         return QIcon(pixmap)
-    
+
+    def _set_gradient(self, gradient, x1, y1, x2, y2):
+        """Move a preallocated linear gradient"""
+        self._start.setX(x1)
+        self._start.setY(y1)
+        self._stop.setX(x2)
+        self._stop.setY(y2)
+        gradient.setStart(self._start)
+        gradient.setFinalStop(self._stop)
+
     def paint_background(self, painter, rect):
         """Paint background"""
-        path = QPainterPath()
-        path.addRoundedRect(QRectF(rect), self.radius, self.radius)
+        x, y, w, h = rect.x(), rect.y(), rect.width(), rect.height()
+        self._bg_rect.setRect(x, y, w, h)
+        self._outline_rect.setRect(x + 0.5, y + 0.5, w - 1, h - 1)
 
         # Draw semi-transparent background
-        painter.setBrush(QColor(20, 20, 20, 120))
-        painter.setPen(Qt.NoPen)
-        painter.drawPath(path)
+        painter.setBrush(self._bg_color)
+        painter.setPen(self._no_pen)
+        painter.drawRoundedRect(self._bg_rect, self.radius, self.radius)
 
         # Draw thin white outline
-        painter.setPen(QPen(QColor(255, 255, 255, 80), 1))
-        painter.setBrush(Qt.NoBrush)
-        painter.drawRoundedRect(QRectF(rect).adjusted(0.5, 0.5, -0.5, -0.5), self.radius, self.radius)
-    
-    def paint_full_mode(self, painter, rect, progress, download_anim, upload_anim, show_percentage, download_speed, upload_speed, font_size):
+        painter.setPen(self._outline_color)
+        painter.setBrush(self._no_brush)
+        painter.drawRoundedRect(self._outline_rect, self.radius, self.radius)
+
+    def paint_full_mode(self, painter, rect, progress, download_anim, upload_anim, show_percentage, download_speed, upload_speed, font_size, language_manager=None):
         """Paint full mode"""
         bar_full_width = rect.width() - 30
         bar_height = 12
-        
+        left = rect.left() + 15
+        dl_top = rect.top() + 35
+        ul_top = rect.top() + 55
+
         # Bar container areas
-        dl_container_rect = QRectF(rect.left() + 15, rect.top() + 35, bar_full_width, bar_height)
-        ul_container_rect = QRectF(rect.left() + 15, rect.top() + 55, bar_full_width, bar_height)
-        
+        self._dl_container_rect.setRect(left, dl_top, bar_full_width, bar_height)
+        self._ul_container_rect.setRect(left, ul_top, bar_full_width, bar_height)
+
         # Actual traffic bar areas
-        dl_rect = QRectF(rect.left() + 15, rect.top() + 35, bar_full_width * download_anim, bar_height)
-        ul_rect = QRectF(rect.left() + 15, rect.top() + 55, bar_full_width * upload_anim, bar_height)
-        
+        dl_width = bar_full_width * download_anim
+        ul_width = bar_full_width * upload_anim
+        self._dl_rect.setRect(left, dl_top, dl_width, bar_height)
+        self._ul_rect.setRect(left, ul_top, ul_width, bar_height)
+
         # Draw container outlines first
-        painter.setPen(QPen(QColor(255, 255, 255, 80), 1))
-        painter.setBrush(Qt.NoBrush)
-        painter.drawRoundedRect(dl_container_rect, 6, 6)
-        painter.drawRoundedRect(ul_container_rect, 6, 6)
-        
+        painter.setPen(self._outline_color)
+        painter.setBrush(self._no_brush)
+        painter.drawRoundedRect(self._dl_container_rect, 6, 6)
+        painter.drawRoundedRect(self._ul_container_rect, 6, 6)
+
         # Download bar gradient - green theme
-        dl_gradient = QLinearGradient(dl_rect.topLeft(), dl_rect.topRight())
-        dl_gradient.setColorAt(0, QColor(76, 175, 80, 220))
-        dl_gradient.setColorAt(1, QColor(129, 199, 132, 220))
-        
+        self._set_gradient(self._dl_h_gradient, left, dl_top, left + dl_width, dl_top)
+
         # Upload bar gradient - orange theme
-        ul_gradient = QLinearGradient(ul_rect.topLeft(), ul_rect.topRight())
-        ul_gradient.setColorAt(0, QColor(255, 152, 0, 220))
-        ul_gradient.setColorAt(1, QColor(255, 183, 77, 220))
-        
+        self._set_gradient(self._ul_h_gradient, left, ul_top, left + ul_width, ul_top)
+
         # Draw actual traffic bars
-        painter.setBrush(dl_gradient)
-        painter.setPen(Qt.NoPen)
-        painter.drawRoundedRect(dl_rect, 6, 6)
-        
-        painter.setBrush(ul_gradient)
-        painter.drawRoundedRect(ul_rect, 6, 6)
-        
+        painter.setBrush(self._dl_h_gradient)
+        painter.setPen(self._no_pen)
+        painter.drawRoundedRect(self._dl_rect, 6, 6)
+
+        painter.setBrush(self._ul_h_gradient)
+        painter.drawRoundedRect(self._ul_rect, 6, 6)
+
         # Text display - with opacity gradient
         alpha = int(255 * (1 - progress))
-        font = QFont("Segoe UI", max(8, int(font_size * (1 - progress * 0.3))))
-        font.setBold(True)
-        painter.setFont(font)
+        self._font.setPointSize(max(8, int(font_size * (1 - progress * 0.3))))
+        painter.setFont(self._font)
+        self._dl_text_color.setAlpha(alpha)
+        self._ul_text_color.setAlpha(alpha)
 
         if show_percentage:
-            dl_percent = int(download_anim * 100)
-            ul_percent = int(upload_anim * 100)
-            
-            painter.setPen(QColor(76, 175, 80, alpha))
-            painter.drawText(rect.left() + 15, rect.top() + 25, f"↓ {dl_percent}%")
-            
-            painter.setPen(QColor(255, 152, 0, alpha))
-            painter.drawText(rect.left() + 15 + rect.width()//2, rect.top() + 25, f"↑ {ul_percent}%")
+            dl_text = DL_PERCENT_TEXT[percent_index(download_anim)]
+            ul_text = UL_PERCENT_TEXT[percent_index(upload_anim)]
         else:
-            # Format speed text
-            if download_speed > 1024:
-                dl_text = f"↓ {download_speed/1024:.1f} MB/s"
-            else:
-                dl_text = f"↓ {download_speed:.1f} KB/s"
-                
-            if upload_speed > 1024:
-                ul_text = f"↑ {upload_speed/1024:.1f} MB/s"
-            else:
-                ul_text = f"↑ {upload_speed:.1f} KB/s"
-            
-            painter.setPen(QColor(76, 175, 80, alpha))
-            painter.drawText(rect.left() + 15, rect.top() + 25, dl_text)
-            
-            painter.setPen(QColor(255, 152, 0, alpha))
-            upload_x = rect.left() + 15 + rect.width()//2
-            painter.drawText(upload_x, rect.top() + 25, ul_text)
-    
+            dl_text = self._dl_text.get(download_speed)
+            ul_text = self._ul_text.get(upload_speed)
+
+        text_pos = self._text_pos
+        text_pos.setY(rect.top() + 25)
+
+        painter.setPen(self._dl_text_color)
+        text_pos.setX(left)
+        painter.drawText(text_pos, dl_text)
+
+        painter.setPen(self._ul_text_color)
+        text_pos.setX(left + rect.width()//2)
+        painter.drawText(text_pos, ul_text)
+
     def paint_compact_mode(self, painter, rect, download_anim, upload_anim):
         """Paint compact mode - vertical bars"""
         # Vertical bar containers
         bar_width = 12
         bar_max_height = rect.height() - 20
         spacing = 8
-        
+
         # Calculate bar positions
         total_width = bar_width * 2 + spacing
         start_x = (rect.width() - total_width) // 2
+        ul_x = start_x + bar_width + spacing
         base_y = rect.bottom() - 10
-        
+        top_y = base_y - bar_max_height
+
         # Bar containers (full range)
-        dl_container_rect = QRectF(start_x, base_y - bar_max_height, bar_width, bar_max_height)
-        ul_container_rect = QRectF(start_x + bar_width + spacing, base_y - bar_max_height, bar_width, bar_max_height)
-        
+        self._dl_container_rect.setRect(start_x, top_y, bar_width, bar_max_height)
+        self._ul_container_rect.setRect(ul_x, top_y, bar_width, bar_max_height)
+
         # Actual displayed bars (based on traffic)
         dl_height = bar_max_height * download_anim
-        dl_rect = QRectF(start_x, base_y - dl_height, bar_width, dl_height)
-        
+        self._dl_rect.setRect(start_x, base_y - dl_height, bar_width, dl_height)
+
         ul_height = bar_max_height * upload_anim
-        ul_rect = QRectF(start_x + bar_width + spacing, base_y - ul_height, bar_width, ul_height)
-        
+        self._ul_rect.setRect(ul_x, base_y - ul_height, bar_width, ul_height)
+
         # Draw container outlines first
-        painter.setPen(QPen(QColor(255, 255, 255, 80), 1))
-        painter.setBrush(Qt.NoBrush)
-        painter.drawRoundedRect(dl_container_rect, 3, 3)
-        painter.drawRoundedRect(ul_container_rect, 3, 3)
-        
+        painter.setPen(self._outline_color)
+        painter.setBrush(self._no_brush)
+        painter.drawRoundedRect(self._dl_container_rect, 3, 3)
+        painter.drawRoundedRect(self._ul_container_rect, 3, 3)
+
         # Download vertical bar gradient - light to dark
-        dl_gradient = QLinearGradient(dl_rect.topLeft(), dl_rect.bottomLeft())
-        dl_gradient.setColorAt(0, QColor(129, 199, 132, 220))  # Light green
-        dl_gradient.setColorAt(1, QColor(76, 175, 80, 220))    # Dark green
-        
+        self._set_gradient(self._dl_v_gradient, start_x, base_y - dl_height, start_x, base_y)
+
         # Upload vertical bar gradient - light to dark
-        ul_gradient = QLinearGradient(ul_rect.topLeft(), ul_rect.bottomLeft())
-        ul_gradient.setColorAt(0, QColor(255, 183, 77, 220))   # Light orange
-        ul_gradient.setColorAt(1, QColor(255, 152, 0, 220))    # Dark orange
-        
+        self._set_gradient(self._ul_v_gradient, ul_x, base_y - ul_height, ul_x, base_y)
+
         # Draw actual traffic bars
-        painter.setBrush(dl_gradient)
-        painter.setPen(Qt.NoPen)
-        painter.drawRoundedRect(dl_rect, 3, 3)
-        
-        painter.setBrush(ul_gradient)
-        painter.drawRoundedRect(ul_rect, 3, 3)
-    
+        painter.setBrush(self._dl_v_gradient)
+        painter.setPen(self._no_pen)
+        painter.drawRoundedRect(self._dl_rect, 3, 3)
+
+        painter.setBrush(self._ul_v_gradient)
+        painter.drawRoundedRect(self._ul_rect, 3, 3)
+
     def paint_mode_bars(self, painter, rect, compact_mode, mode_progress, download_anim, upload_anim, show_percentage, download_speed, upload_speed, font_size):
         """Paint mode switching animation bars (unified entry)"""
         if compact_mode or mode_progress > 0.1:
@@ -169,27 +260,19 @@ class UIPainter:
         else:
             # Full mode - show horizontal bars and text
             self.paint_full_mode(painter, rect, mode_progress, download_anim, upload_anim, show_percentage, download_speed, upload_speed, font_size)
-    
+
     def calculate_text_length(self, show_percentage, download_anim, upload_anim, download_speed, upload_speed):
         """Calculate required width for current text"""
-        test_font = QFont("Segoe UI", 10)
-        metrics = QFontMetrics(test_font)
-        
         if show_percentage:
-            dl_percent = int(download_anim * 100)
-            ul_percent = int(upload_anim * 100)
-            text = f"↓ {dl_percent}%  ↑ {ul_percent}%"
+            dl_text = DL_PERCENT_TEXT[percent_index(download_anim)]
+            ul_text = UL_PERCENT_TEXT[percent_index(upload_anim)]
         else:
-            if download_speed > 1024:
-                dl_text = f"↓ {download_speed/1024:.1f} MB/s"
-            else:
-                dl_text = f"↓ {download_speed:.1f} KB/s"
-                
-            if upload_speed > 1024:
-                ul_text = f"↑ {upload_speed/1024:.1f} MB/s"
-            else:
-                ul_text = f"↑ {upload_speed:.1f} KB/s"
-            
-            text = f"{dl_text}  {ul_text}"
-        
-        return metrics.width(text)
\ No newline at end of file
+            dl_text = self._dl_text.get(download_speed)
+            ul_text = self._ul_text.get(upload_speed)
+
+        # Labels are cached, so identity tells us whether the text changed
+        if dl_text is not self._measured_dl or ul_text is not self._measured_ul:
+            self._measured_dl = dl_text
+            self._measured_ul = ul_text
+            self._measured_width = self._metrics.horizontalAdvance(f"{dl_text}  {ul_text}")
+        return self._measured_width
\ No newline at end of file
@@ -0,0 +1,91 @@
+"""
+Regenerate the synthetic traces in tools/traces that
+`python tools/sampling_stats.py check` replays.
+
+    python tools/make_traces.py
+
+Every trace comes from a fixed seed, so rerunning this rewrites the
+checked-in files byte for byte. Traces are (time, bytes_recv, bytes_sent)
+rows in the same CSV format that `sampling_stats.py record` writes.
+"""
+
+import os
+import csv
+import random
+
+TRACES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'traces')
+
+
+def idle(seconds=600, resolution=0.1, seed=1):
+    """~0.5 KB/s of keepalive / DNS sized packets: a 60-1500 byte packet
+    with probability 0.6 per second, 60% of them received"""
+    rnd = random.Random(seed)
+    t = 0.0
+    recv = sent = 0
+    samples = []
+    while t < seconds:
+        if rnd.random() < 0.6 * resolution:
+            size = rnd.randint(60, 1500)
+            if rnd.random() < 0.6:
+                recv += size
+            else:
+                sent += size
+        samples.append((round(t, 3), recv, sent))
+        t += resolution
+    return samples
+
+
+def bursty(seconds=120, resolution=0.05, seed=2):
+    """On/off transfers: 0.5-3 s at 1-8 MB/s (+-50% per sample, 5% upload)
+    alternating with 0.5-3 s of silence"""
+    rnd = random.Random(seed)
+    t = 0.0
+    recv = sent = 0
+    rate = 0
+    until = 0
+    samples = []
+    while t < seconds:
+        if t >= until:
+            rate = rnd.uniform(1e6, 8e6) if rate == 0 else 0
+            until = t + rnd.uniform(0.5, 3)
+        recv += int(rate * resolution * rnd.uniform(0.5, 1.5))
+        sent += int(rate * resolution * 0.05)
+        samples.append((round(t, 3), recv, sent))
+        t += resolution
+    return samples
+
+
+def steady(seconds=120, resolution=0.1, seed=3, rate=10 * 1024 * 1024):
+    """One long download at `rate` bytes/s (+-5% per sample, 2% upload)"""
+    rnd = random.Random(seed)
+    t = 0.0
+    recv = sent = 0
+    samples = []
+    while t < seconds:
+        recv += int(rate * resolution * rnd.uniform(0.95, 1.05))
+        sent += int(rate * resolution * 0.02)
+        samples.append((round(t, 3), recv, sent))
+        t += resolution
+    return samples
+
+
+def write(name, samples):
+    path = os.path.join(TRACES, name)
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['time', 'bytes_recv', 'bytes_sent'])
+        for t, recv, sent in samples:
+            writer.writerow([f"{t:.3f}", recv, sent])
+    print(f"{path}: {len(samples)} samples")
+
+
+def main():
+    if not os.path.exists(TRACES):
+        os.makedirs(TRACES)
+    write('idle.csv', idle())
+    write('bursty.csv', bursty())
+    write('steady.csv', steady())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Record network traffic traces and measure how many wakeups the adaptive
+sampler saves compared with a fixed 1 s speed_timer.
+
+    python tools/sampling_stats.py record trace.csv --seconds 600
+    python tools/sampling_stats.py replay trace.csv [trace2.csv ...]
+    python tools/sampling_stats.py check
+
+`check` replays the checked-in traces in tools/traces and exits non-zero
+unless the sampler backs off on an idle link (idle.csv, ~0.5 KB/s of
+keepalive/DNS sized packets), speeds up on bursts (bursty.csv, on/off
+transfers of 1-8 MB/s) and keeps the base cadence during a steady download
+(steady.csv, 10 MB/s). The traces are synthetic and seeded; regenerate them
+with `python tools/make_traces.py`.
+"""
+
+import os
+import sys
+import csv
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+TRACES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'traces')
+
+import psutil
+from py.network_monitor import replay_trace
+
+
+def record(path, seconds, resolution):
+    """Record (monotonic_time, bytes_recv, bytes_sent) samples to a CSV file"""
+    end = time.monotonic() + seconds
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['time', 'bytes_recv', 'bytes_sent'])
+        while time.monotonic() < end:
+            counters = psutil.net_io_counters()
+            writer.writerow([f"{time.monotonic():.6f}", counters.bytes_recv, counters.bytes_sent])
+            time.sleep(resolution)
+
+
+def load(path):
+    """Stream samples back from a CSV trace"""
+    with open(path, 'r', newline='', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        next(reader, None)
+        for row in reader:
+            yield float(row[0]), int(row[1]), int(row[2])
+
+
+def check():
+    """Replay the checked-in traces and return True if the sampler behaves"""
+    ok = True
+
+    idle = replay_trace(load(os.path.join(TRACES, 'idle.csv')))
+    # Idle link: must back off to well under half the fixed cadence
+    idle_ok = idle['wakeups_saved'] >= idle['fixed_wakeups'] // 2
+    ok = ok and idle_ok
+    print(f"idle: adaptive {idle['wakeups']} wakeups, fixed {idle['fixed_wakeups']} - {'ok' if idle_ok else 'FAILED'}")
+
+    bursty = replay_trace(load(os.path.join(TRACES, 'bursty.csv')))
+    # Bursts: must sample faster than the fixed cadence
+    bursty_ok = bursty['wakeups'] >= bursty['fixed_wakeups'] * 2
+    ok = ok and bursty_ok
+    print(f"bursty: adaptive {bursty['wakeups']} wakeups, fixed {bursty['fixed_wakeups']} - {'ok' if bursty_ok else 'FAILED'}")
+
+    steady = replay_trace(load(os.path.join(TRACES, 'steady.csv')))
+    # Steady transfer: calm, but never slower than the fixed cadence
+    steady_ok = steady['wakeups'] >= steady['fixed_wakeups']
+    ok = ok and steady_ok
+    print(f"steady: adaptive {steady['wakeups']} wakeups, fixed {steady['fixed_wakeups']} - {'ok' if steady_ok else 'FAILED'}")
+
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    rec = sub.add_parser('record', help='record a trace')
+    rec.add_argument('path')
+    rec.add_argument('--seconds', type=float, default=300)
+    rec.add_argument('--resolution', type=float, default=0.02, help='sample spacing in seconds')
+
+    rep = sub.add_parser('replay', help='replay traces through the adaptive sampler')
+    rep.add_argument('paths', nargs='+')
+    rep.add_argument('--min-interval', type=float, default=0.1)
+    rep.add_argument('--max-interval', type=float, default=5.0)
+    rep.add_argument('--base-interval', type=float, default=1.0, help='fixed cadence to compare against')
+
+    sub.add_parser('check', help='assert wakeup savings on the checked-in traces')
+
+    args = parser.parse_args()
+
+    if args.command == 'check':
+        sys.exit(0 if check() else 1)
+
+    if args.command == 'record':
+        record(args.path, args.seconds, args.resolution)
+        return
+
+    for path in args.paths:
+        stats = replay_trace(
+            load(path),
+            min_interval=args.min_interval,
+            max_interval=args.max_interval,
+            base_interval=args.base_interval
+        )
+        saved = stats['wakeups_saved']
+        ratio = saved / stats['fixed_wakeups'] * 100 if stats['fixed_wakeups'] else 0.0
+        print(f"{path}: {stats['elapsed']:.1f}s, "
+              f"adaptive {stats['wakeups']} wakeups, fixed {stats['fixed_wakeups']}, "
+              f"saved {saved} ({ratio:.1f}%)")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
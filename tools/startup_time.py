@@ -0,0 +1,90 @@
+"""
+Measure time-to-first-paint (and time until the deferred tray/menu stage
+has finished) for the source tree and for frozen builds.
+
+    python tools/startup_time.py [--runs 10]
+    python tools/startup_time.py --frozen "dist/NetFloater v1.3/NetFloater v1.3.exe" --frozen "dist/NetFloater v1.3.exe"
+
+Each run launches the app with NETFLOATER_STARTUP_PROBE pointing at a temp
+file; main.py logs wall-clock times there and quits after startup. Exits
+non-zero if the tray/menu stage ever finishes before the first paint.
+"""
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+import statistics
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_once(command, timeout):
+    """Launch once and return (first_paint, startup_complete) seconds after spawn"""
+    fd, probe = tempfile.mkstemp(prefix='netfloater_probe_', suffix='.txt')
+    os.close(fd)
+    env = dict(os.environ, NETFLOATER_STARTUP_PROBE=probe)
+    try:
+        spawned = time.time()
+        subprocess.run(command, cwd=ROOT, env=env, timeout=timeout,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        events = {}
+        with open(probe, 'r', encoding='utf-8') as f:
+            for line in f:
+                name, stamp = line.split()
+                events[name] = float(stamp) - spawned
+        return events.get('first_paint'), events.get('startup_complete')
+    finally:
+        os.remove(probe)
+
+
+def measure(name, command, runs, timeout):
+    """Print first paint / startup complete medians and return True if startup was staged correctly"""
+    first_paint, complete = [], []
+    for _ in range(runs):
+        try:
+            paint, done = run_once(command, timeout)
+        except subprocess.TimeoutExpired:
+            print(f"{name}: timed out after {timeout}s")
+            return False
+        if paint is None:
+            print(f"{name}: no first paint recorded")
+            return False
+        if done is not None and done < paint:
+            # The deferred stage must never delay the first frame
+            print(f"{name}: startup completed {(paint - done) * 1000:.1f} ms before first paint")
+            return False
+        first_paint.append(paint * 1000)
+        if done is not None:
+            complete.append(done * 1000)
+
+    print(f"{name}: first paint median {statistics.median(first_paint):.0f} ms "
+          f"(min {min(first_paint):.0f}, max {max(first_paint):.0f})", end='')
+    if complete:
+        print(f", startup complete median {statistics.median(complete):.0f} ms")
+    else:
+        print()
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--timeout', type=float, default=60)
+    parser.add_argument('--frozen', action='append', default=[], metavar='EXE', help='frozen build to measure (repeatable)')
+    parser.add_argument('--no-source', action='store_true', help='skip the source tree run')
+    args = parser.parse_args()
+
+    ok = True
+    if not args.no_source:
+        ok = measure('source', [sys.executable, os.path.join(ROOT, 'main.py')], args.runs, args.timeout) and ok
+    for exe in args.frozen:
+        ok = measure(os.path.basename(exe), [os.path.abspath(exe)], args.runs, args.timeout) and ok
+
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
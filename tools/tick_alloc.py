@@ -0,0 +1,171 @@
+"""
+Allocation regression check for the steady-state sample -> animate -> paint
+tick path. Builds a real FloaterWidget offscreen, drives its updateSpeed,
+updateAnimation, updateModeAnimation and paintEvent (through repaint) for
+thousands of ticks under tracemalloc, and exits non-zero if Python
+allocations per tick go over budget.
+
+    python tools/tick_alloc.py [--ticks 5000] [--budget 576]
+
+The clock and the counters are stubbed so every tick sees the same traffic
+rate, which is what steady state means here. History recording is left on,
+so the budget also covers the ticks that flush a full history buffer.
+
+What remains within budget is PyQt wrapping the QPaintEvent for the Python
+paintEvent override, ints/floats from the delta arithmetic - neither can
+be preallocated - and sip rejecting the QColor overload of
+QPainter.setPen before taking the preallocated QPen(Qt.NoPen).
+"""
+
+import os
+import sys
+import argparse
+import tempfile
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+# Keep config and history away from the real profile
+os.environ['APPDATA'] = tempfile.mkdtemp(prefix='netfloater_tick_')
+
+from PyQt5.QtWidgets import QApplication
+
+from main import FloaterWidget
+
+# Simulated time per tick and traffic rate in bytes/s
+STEP = 1.0
+RECV_RATE = 300 * 1024
+SENT_RATE = 40 * 1024
+
+
+class FakeClock:
+    """Monotonic and wall clocks that only move when advanced"""
+    __slots__ = ('now', 'wall')
+
+    def __init__(self):
+        self.now = 1000.0
+        # Midnight UTC, so runs shorter than a day never switch history segments
+        self.wall = 19675 * 86400.0
+
+    def monotonic(self):
+        return self.now
+
+    def time(self):
+        return self.wall
+
+    def advance(self, seconds):
+        self.now += seconds
+        self.wall += seconds
+
+
+class SteadyCounters:
+    """Stand-in for psutil.net_io_counters(pernic=True) with one interface
+    at a constant traffic rate.
+
+    psutil allocates internally on every read, which says nothing about our
+    own tick path, so the budget is measured against this instead.
+    """
+    __slots__ = ('bytes_recv', 'bytes_sent', 'nics')
+
+    def __init__(self):
+        self.bytes_recv = 0
+        self.bytes_sent = 0
+        self.nics = {'eth0': self}
+
+    def advance(self, seconds):
+        self.bytes_recv += int(RECV_RATE * seconds)
+        self.bytes_sent += int(SENT_RATE * seconds)
+
+    def __call__(self):
+        return self.nics
+
+
+def make_widget(show_percentage, compact_mode):
+    """Build a FloaterWidget wired to the fake clock and counters"""
+    widget = FloaterWidget()
+    # Run the deferred startup stage, then stop the real timers - ticks are driven by hand
+    QApplication.processEvents()
+    widget.finishStartup()
+    for timer in (widget.speed_timer, widget.animation_timer, widget.mode_anim_timer):
+        timer.stop()
+
+    widget.show_percentage = show_percentage
+    widget.compact_mode = compact_mode
+    widget.mode_progress = widget.mode_anim_target = 1.0 if compact_mode else 0.0
+    widget.resize(60, 110) if compact_mode else widget.resize(220, 80)
+    widget.show()
+    QApplication.processEvents()
+
+    clock = FakeClock()
+    counters = SteadyCounters()
+    monitor = widget.network_monitor
+    monitor.clock = clock.monotonic
+    monitor.wall_clock = clock.time
+    monitor.read_counters = counters
+    monitor.deltas.read_link_stats = None
+    return widget, clock, counters
+
+
+def tick(widget, clock, counters):
+    """One speed sample, animation step and repaint"""
+    clock.advance(STEP)
+    counters.advance(STEP)
+    widget.updateSpeed()
+    widget.updateAnimation()
+    widget.updateModeAnimation()
+    widget.repaint()
+
+
+def measure(ticks, warmup, show_percentage, compact_mode):
+    """Return (peak bytes allocated within one tick, retained bytes per tick)"""
+    widget, clock, counters = make_widget(show_percentage, compact_mode)
+
+    # Trace the warmup too - the first traced tick pays for tracemalloc's own setup
+    tracemalloc.start()
+    for _ in range(warmup):
+        tick(widget, clock, counters)
+
+    start, _ = tracemalloc.get_traced_memory()
+    worst = 0
+    for _ in range(ticks):
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        tick(widget, clock, counters)
+        _, peak = tracemalloc.get_traced_memory()
+        worst = max(worst, peak - before)
+    end, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    widget.history_store.close()
+    widget.tray.hide()
+    widget.deleteLater()
+    return worst, (end - start) / ticks
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--ticks', type=int, default=5000)
+    parser.add_argument('--warmup', type=int, default=200)
+    parser.add_argument('--budget', type=int, default=576, help='max bytes allocated within a single tick')
+    parser.add_argument('--retained-budget', type=float, default=1.0, help='max bytes retained per tick')
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+
+    failed = False
+    for name, show_percentage, compact_mode in (
+        ('full/speed', False, False),
+        ('full/percentage', True, False),
+        ('compact', False, True),
+    ):
+        worst, retained = measure(args.ticks, args.warmup, show_percentage, compact_mode)
+        ok = worst <= args.budget and retained <= args.retained_budget
+        failed = failed or not ok
+        print(f"{name}: peak {worst} B/tick, retained {retained:.2f} B/tick - {'ok' if ok else 'OVER BUDGET'}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file